@@ -21,7 +21,6 @@ release = version = config.version
 # Links to other documentation
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3/", None),
-    "bidict": ("https://bidict.readthedocs.io/en/main/", None),
     "numpy": ("https://numpy.org/doc/stable/", None),
     "pillow": ("https://pillow.readthedocs.io/en/stable/", None),
 }
@@ -6,12 +6,17 @@
 
 """Functions to deal with math operations."""
 
+from functools import cache
 from math import isqrt
 
 
+@cache
 def find_medium_divisors(n: int) -> tuple[int, int]:
     """Return the medium divisors of an integer.
 
+    The result is cached, as character tables of a given size keep being laid out
+    with the same number of rows and columns.
+
     Raises:
         ValueError: The input is not a positive integer.
         AssertionError: Unreachable due to the identity property.
@@ -2,4 +2,8 @@
 #
 # SPDX-License-Identifier: MIT
 
-"""A commandline interface for the conversion tools."""
+"""A commandline interface for the conversion tools.
+
+The formats are imported inside the commands that use them, so running one command
+does not need to load the dependencies of every other format.
+"""
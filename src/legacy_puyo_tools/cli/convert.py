@@ -22,10 +22,6 @@ from legacy_puyo_tools.cli._confopts import (
     padding_option,
     table_options,
 )
-from legacy_puyo_tools.formats.fmp import Fmp
-from legacy_puyo_tools.formats.fnt import Fnt
-from legacy_puyo_tools.formats.fpd import Fpd
-from legacy_puyo_tools.formats.mtx import Mtx
 from legacy_puyo_tools.typing import (
     FmpFontSize,
     FontFormat,
@@ -57,6 +53,8 @@ def convert_fmp(
 
     Image format defaults to PNG.
     """
+    from legacy_puyo_tools.formats.fmp import Fmp  # pylint: disable=import-outside-toplevel
+
     with input_file.open("rb") as in_fp:
         Fmp.decode(in_fp, font_size=font_size).write_image(
             padding=padding, orientation=orientation
@@ -88,6 +86,8 @@ def convert_fnt(
     Optionally character graphics can also be extract to an image if available.
     Image format defaults to PNG.
     """
+    from legacy_puyo_tools.formats.fnt import Fnt  # pylint: disable=import-outside-toplevel
+
     with input_file.open("rb") as in_fp:
         fnt = Fnt.decode(in_fp)
 
@@ -112,6 +112,8 @@ def convert_fnt(
 @output_option
 def convert_fpd(input_file: Path, output_file: Path | None) -> None:
     """Extract characters from a fpd file to a CSV table."""
+    from legacy_puyo_tools.formats.fpd import Fpd  # pylint: disable=import-outside-toplevel
+
     with (
         input_file.open("rb") as in_fp,
         get_output_path(input_file, output_file, ".csv").open(
@@ -134,6 +136,10 @@ def convert_mtx(
     font_format: FontFormat,
 ) -> None:
     """Extract text from a mtx file."""
+    from legacy_puyo_tools.formats.fnt import Fnt  # pylint: disable=import-outside-toplevel
+    from legacy_puyo_tools.formats.fpd import Fpd  # pylint: disable=import-outside-toplevel
+    from legacy_puyo_tools.formats.mtx import Mtx  # pylint: disable=import-outside-toplevel
+
     if table_format == "CSV":
         with table.open("r", encoding="utf-8", newline="") as table_fp:
             if font_format == "FNT":
@@ -151,4 +157,4 @@ def convert_mtx(
         input_file.open("rb") as in_fp,
         get_output_path(input_file, output_file, ".xml").open("wb") as out_fp,
     ):
-        out_fp.write(Mtx.decode(in_fp).write_xml(font))
+        Mtx.decode(in_fp).write_xml(out_fp, font)
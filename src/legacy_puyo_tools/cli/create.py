@@ -7,7 +7,6 @@
 from pathlib import Path
 
 import cloup
-from PIL import Image
 
 from legacy_puyo_tools.cli._confopts import (
     fmp_options,
@@ -21,9 +20,6 @@ from legacy_puyo_tools.cli._confopts import (
     padding_option,
 )
 from legacy_puyo_tools.formats._csv import CSV_TABLE_HEADER
-from legacy_puyo_tools.formats.fmp import Fmp
-from legacy_puyo_tools.formats.fnt import Fnt
-from legacy_puyo_tools.formats.fpd import Fpd
 from legacy_puyo_tools.typing import (
     FmpFontSize,
     FntFormatVersion,
@@ -50,6 +46,10 @@ def create_fmp(
     padding: int,
 ) -> None:
     """Create a fmp file from an image."""
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    from legacy_puyo_tools.formats.fmp import Fmp  # pylint: disable=import-outside-toplevel
+
     with (
         Image.open(input_file) as im,
         get_output_path(input_file, output_file, ".fmp").open("wb") as out_fp,
@@ -79,6 +79,10 @@ def create_fnt(  # pylint: disable=too-many-arguments,too-many-positional-argume
     Able to create multiple versions used by the Nintendo DS, Wii, or the
     PlayStation Portable.
     """
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    from legacy_puyo_tools.formats.fnt import Fnt  # pylint: disable=import-outside-toplevel
+
     with input_file.open("r", encoding="utf-8", newline="") as in_fp:
         fnt = Fnt.read_csv(in_fp, font_height=font_height, font_width=font_width)
 
@@ -99,6 +103,8 @@ def create_fnt(  # pylint: disable=too-many-arguments,too-many-positional-argume
 @output_option
 def create_fpd(input_file: Path, output_file: Path | None) -> None:
     """Create a fpd file from a CSV table containing character and width."""
+    from legacy_puyo_tools.formats.fpd import Fpd  # pylint: disable=import-outside-toplevel
+
     with (
         input_file.open("r", encoding="utf-8", newline="") as in_fp,
         get_output_path(input_file, output_file, ".fpd").open("wb") as out_fp,
@@ -29,7 +29,7 @@ def decompress_lz11(input_file: Path, output_file: Path | None) -> None:
     """Decompress a LZ11 compressed file."""
     with (
         input_file.open("rb") as in_fp,
-        get_output_path(input_file, output_file, None).open("wb+") as out_fp,
+        get_output_path(input_file, output_file, None).open("wb") as out_fp,
     ):
         if in_fp.read(4) != lz11.COMP_LZ11_MAGIC_NUMBER:
             in_fp.seek(0)
@@ -8,7 +8,6 @@
 """LZ11, LZSS-based compression algorithm used by Nintendo on the DS and 3DS."""
 
 import io
-from os import SEEK_END
 from typing import BinaryIO
 
 from legacy_puyo_tools.exceptions import DecompressionError
@@ -21,6 +20,24 @@ LZ11_MAGIC_NUMBER = b"\x11"
 COMP_LZ11_MAGIC_NUMBER = b"COMP"
 
 
+def _copy_back_reference(data: bytearray, count: int, disp: int) -> None:
+    if disp > len(data):
+        raise DecompressionError(
+            "Compressed data refers to bytes before the start of the decompressed "
+            "data.",
+            "LZ11",
+        )
+
+    start = len(data) - disp
+
+    if count <= disp:
+        data += data[start : start + count]
+    else:
+        # The repeated bytes overlap the bytes that are being written, so repeat the
+        # window until it covers the whole count
+        data += (data[start:] * (count // disp + 1))[:count]
+
+
 def decompress_lz11(in_fp: BinaryIO, out_fp: BinaryIO) -> None:
     """Decompress a LZ11 compressed file.
 
@@ -32,15 +49,17 @@ def decompress_lz11(in_fp: BinaryIO, out_fp: BinaryIO) -> None:
 
     Raises:
         io.UnsupportedOperation:
-            Unable to perform seek or read operations on the file handlers.
+            Unable to perform seek operations on the compressed file handler.
         DecompressionError:
             The input file is not a LZ11 compressed file.
+        DecompressionError:
+            The compressed data is truncated or refers to data that does not exist.
         DecompressionError:
             The decompressed file size is not the same as the expected file size.
     """
-    if not in_fp.seekable() or not out_fp.readable():
+    if not in_fp.seekable():
         raise io.UnsupportedOperation(
-            "Unable to perform seek or read operations on the file handlers."
+            "Unable to perform seek operations on the compressed file handler."
         )
 
     if in_fp.read(1) != LZ11_MAGIC_NUMBER:
@@ -56,59 +75,60 @@ def decompress_lz11(in_fp: BinaryIO, out_fp: BinaryIO) -> None:
         else int.from_bytes(in_fp.read(4), DECOMPRESSION_SIZE_ENDIAN)
     )
 
-    def read_byte() -> int:
-        return int.from_bytes(in_fp.read(1))
-
-    while out_fp.tell() < decompressed_size:
-        flag = read_byte()
-
-        for _ in range(_BITS_IN_BYTES):
-            # Not compressed
-            if flag & (1 << 7) == 0:
-                out_fp.write(in_fp.read(1))
-            # Compressed
-            else:
-                byte = read_byte()
-                indicator = byte >> 4
-
-                match indicator:
-                    case 0:
-                        # 8 bit count, 12 bit disp
-                        # indicator is 0, don't need to mask b
-                        count = byte << 4
-                        byte = read_byte()
-                        count += byte >> 4
-                        count += 0x11
-                    case 1:
-                        # 16 bit count, 12 bit disp
-                        count = ((byte & 0xF) << 12) + (read_byte() << 4)
-                        byte = read_byte()
-                        count += byte >> 4
-                        count += 0x111
-                    case _:
-                        # indicator is count (4 bits), 12 bit disp
-                        count = indicator
-                        count += 1
-
-                disp = ((byte & 0xF) << 8) + read_byte()
-                disp += 1
-
-                # Needs a for loop to account that there are no bytes are written at the
-                # beginning
-                for _ in range(count):
-                    out_fp.seek(-disp, SEEK_END)
-                    repeat_byte = out_fp.read(1)
-                    out_fp.seek(0, SEEK_END)
-                    out_fp.write(repeat_byte)
-
-            if out_fp.tell() >= decompressed_size:
-                break
-
-            flag <<= 1
-
-    if out_fp.tell() != decompressed_size:
+    # Decompress in memory, as copying repeated bytes within a bytearray is much
+    # faster than seeking and reading them back from the output file one at a time
+    compressed_data = iter(in_fp.read())
+    decompressed_data = bytearray()
+
+    try:
+        while len(decompressed_data) < decompressed_size:
+            flag = next(compressed_data)
+
+            for _ in range(_BITS_IN_BYTES):
+                # Not compressed
+                if flag & (1 << 7) == 0:
+                    decompressed_data.append(next(compressed_data))
+                # Compressed
+                else:
+                    byte = next(compressed_data)
+                    indicator = byte >> 4
+
+                    match indicator:
+                        case 0:
+                            # 8 bit count, 12 bit disp
+                            # indicator is 0, don't need to mask b
+                            count = byte << 4
+                            byte = next(compressed_data)
+                            count += byte >> 4
+                            count += 0x11
+                        case 1:
+                            # 16 bit count, 12 bit disp
+                            count = ((byte & 0xF) << 12) + (next(compressed_data) << 4)
+                            byte = next(compressed_data)
+                            count += byte >> 4
+                            count += 0x111
+                        case _:
+                            # indicator is count (4 bits), 12 bit disp
+                            count = indicator
+                            count += 1
+
+                    disp = ((byte & 0xF) << 8) + next(compressed_data)
+                    disp += 1
+
+                    _copy_back_reference(decompressed_data, count, disp)
+
+                if len(decompressed_data) >= decompressed_size:
+                    break
+
+                flag <<= 1
+    except StopIteration as e:
+        raise DecompressionError("The compressed data ended early.", "LZ11") from e
+
+    if len(decompressed_data) != decompressed_size:
         raise DecompressionError(
             "Decompressed size does not match the expected size.\n"
-            f"Expected: {decompressed_size}\nActual: {out_fp.tell()}",
+            f"Expected: {decompressed_size}\nActual: {len(decompressed_data)}",
             "LZ11",
         )
+
+    out_fp.write(decompressed_data)
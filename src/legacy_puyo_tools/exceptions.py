@@ -18,3 +18,21 @@ class DecompressionError(Exception):
 
 class FileFormatError(Exception):
     """The file being decoded does not conform to the implemented file format."""
+
+
+def non_bmp_encode_error(character: str) -> UnicodeEncodeError:
+    """Create the error for a character that cannot be encoded to 16 bits.
+
+    Arguments:
+        character: The character that is outside of the Basic Multilingual Plane.
+
+    Returns:
+        A `UnicodeEncodeError` for the character.
+    """
+    return UnicodeEncodeError(
+        "UTF-16",
+        character,
+        0,
+        1,
+        "Character is not in the BMP or a code point from U+0000 to U+FFFF",
+    )
@@ -8,6 +8,7 @@ from collections.abc import Callable, Sequence
 from typing import BinaryIO
 
 import numpy as np
+import numpy.typing as npt
 from PIL import Image
 
 from legacy_puyo_tools._math import find_medium_divisors
@@ -18,31 +19,29 @@ BITS_PER_BYTE = 8
 PIXELS_PER_BYTE = BITS_PER_BYTE // BITS_PER_PIXEL
 
 
-def parse_4bpp_graphic(graphic_data: bytes, graphic_width: int) -> BitmapGraphic:
-    graphic: list[list[int]] = []
+def parse_4bpp_graphic(
+    graphic_data: bytes | memoryview, graphic_width: int
+) -> BitmapGraphic:
+    graphic = np.frombuffer(graphic_data, dtype=np.uint8).reshape(-1, graphic_width)
 
-    for row in range(0, len(graphic_data), graphic_width):
-        graphic_row: list[int] = []
+    # Swap byte order as the graphics data is little endian
+    pixels = np.stack((graphic & 0xF, graphic >> BITS_PER_PIXEL), axis=-1)
 
-        for byte in graphic_data[row : row + graphic_width]:
-            # Swap byte order as the graphics data is little endian
-            lower_nibble, upper_nibble = (byte >> BITS_PER_PIXEL), byte & 0xF
-            graphic_row.extend((upper_nibble, lower_nibble))
+    # Give the row length explicitly, since it cannot be inferred when there are no rows
+    row_length = graphic_width * PIXELS_PER_BYTE
 
-        graphic.append(graphic_row)
+    return pixels.reshape(graphic.shape[0], row_length).astype(bool)
 
-    return np.array(graphic, dtype=bool)
 
+def pack_4bpp_graphic(graphic: BitmapGraphic) -> npt.NDArray[np.uint8]:
+    pixels = graphic.reshape(-1, PIXELS_PER_BYTE).astype(np.uint8)
 
-def write_4bpp_graphic(fp: BinaryIO, graphic: BitmapGraphic) -> None:
-    for i in range(0, graphic.size, PIXELS_PER_BYTE):
-        pixels = graphic[i : i + PIXELS_PER_BYTE]
+    # Swap byte order as fmp is little endian
+    return np.left_shift(pixels[:, 1], BITS_PER_PIXEL, dtype=np.uint8) | pixels[:, 0]
 
-        # Swap byte order as fmp is little endian
-        lower_nubble, upper_nibble = pixels.tolist()
-        byte: int = (upper_nibble << BITS_PER_PIXEL) | lower_nubble
 
-        fp.write(byte.to_bytes())
+def write_4bpp_graphic(fp: BinaryIO, graphic: BitmapGraphic) -> None:
+    fp.write(pack_4bpp_graphic(graphic))
 
 
 def parse_graphics_from_image[T: BitmapGraphic](
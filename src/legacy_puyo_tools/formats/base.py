@@ -8,6 +8,8 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterator
+from itertools import count
 from typing import BinaryIO, Protocol
 
 
@@ -50,3 +52,15 @@ class BaseCharacterTable(Protocol):
     def __str__(self) -> str:
         """Return all of the characters in the character table as a string."""
         raise NotImplementedError
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the characters in the character table by index.
+
+        Yields:
+            Each character in the character table in order.
+        """
+        for index in count():
+            try:
+                yield self[index]
+            except IndexError:
+                return
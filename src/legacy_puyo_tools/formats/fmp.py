@@ -80,14 +80,18 @@ class Fmp(BaseFileFormat):
 
         fp.seek(0)
 
-        graphics: list[FmpCharacterGraphic] = []
+        # Slicing a memoryview does not copy each graphic out of the fmp
+        fmp_data = memoryview(fp.read())
 
-        while graphic := fp.read(graphic_size):
-            graphics.append(
-                FmpCharacterGraphic(parse_4bpp_graphic(graphic, graphic_width))
-            )
-
-        return cls(graphics, font_size)
+        return cls(
+            [
+                FmpCharacterGraphic(
+                    parse_4bpp_graphic(fmp_data[i : i + graphic_size], graphic_width)
+                )
+                for i in range(0, len(fmp_data), graphic_size)
+            ],
+            font_size,
+        )
 
     def encode(self, fp: BinaryIO) -> None:
         """Encode the fmp character graphics table to a file-like object.
@@ -15,6 +15,7 @@ import csv
 import io
 import struct
 from collections import OrderedDict
+from collections.abc import Iterator
 from os import SEEK_END
 from typing import BinaryIO, TextIO
 
@@ -22,13 +23,13 @@ import attrs
 import numpy as np
 from PIL import Image
 
-from legacy_puyo_tools.exceptions import FileFormatError
+from legacy_puyo_tools.exceptions import FileFormatError, non_bmp_encode_error
 from legacy_puyo_tools.formats._csv import CSV_TABLE_HEADER, get_csv_reader
 from legacy_puyo_tools.formats._graphics import (
     PIXELS_PER_BYTE,
+    pack_4bpp_graphic,
     parse_4bpp_graphic,
     parse_graphics_from_image,
-    write_4bpp_graphic,
     write_graphics_to_image,
 )
 from legacy_puyo_tools.formats.base import (
@@ -54,12 +55,12 @@ FNT_HEADER_LENGTH = (
     + FNT_CHARACTER_LENGTH_WORD_SIZE
 )
 
-FNT_CHARACTER_ENTRY_FORMAT = "<HH"
 FNT_CHARACTER_WORD_SIZE = 2
 FNT_CHARACTER_WIDTH_WORD_SIZE = 2
 FNT_CHARACTER_ENTRY_FORMAT_LENGTH = (
     FNT_CHARACTER_WORD_SIZE + FNT_CHARACTER_WIDTH_WORD_SIZE
 )
+FNT_CHARACTER_ENTRY_DTYPE = np.dtype([("code_point", "<u2"), ("width", "<u2")])
 
 FNT_NDS_IDENTIFIER = b"\xe0\x03\xff\x7f\xc6\x18"
 FNT_NDS_IDENTIFIER_LENGTH = 6
@@ -89,19 +90,21 @@ class Fnt(BaseFileFormat, BaseCharacterTable):
         """Return a character from the fnt character table."""
         return list(self.font)[index]
 
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator over the characters in the fnt character table."""
+        return iter(self.font)
+
     def __str__(self) -> str:
         """Return all of the characters in the fnt character table as a string."""
-        with io.StringIO() as string_buffer:
-            for character in self.font:
-                string_buffer.write(character)
-
-            return string_buffer.getvalue()
+        return "".join(self.font)
 
     def _get_fnt_graphics(self, character: FntCharacter) -> FntCharacterGraphic:
         return (
             character.graphic
             if character.graphic is not None
-            else FntCharacterGraphic(np.zeros(self.graphic_size, dtype=bool))
+            else FntCharacterGraphic(
+                np.zeros((self.font_height, self.font_width), dtype=bool)
+            )
         )
 
     def has_graphics(self) -> bool:
@@ -157,23 +160,36 @@ class Fnt(BaseFileFormat, BaseCharacterTable):
 
             fp.seek(FNT_HEADER_LENGTH + FNT_NDS_HEADER_LENGTH)
 
-        character_table: OrderedDict[str, FntCharacter] = OrderedDict()
-
-        for _ in range(character_length):
-            code_point, width = struct.unpack(
-                FNT_CHARACTER_ENTRY_FORMAT, fp.read(FNT_CHARACTER_ENTRY_FORMAT_LENGTH)
-            )
+        entry_fields = FNT_CHARACTER_ENTRY_DTYPE.descr
 
-            graphic = None
+        if parse_graphics:
+            entry_fields.append(("graphic", "u1", (graphic_size,)))
 
-            if parse_graphics:
-                graphic = FntCharacterGraphic(
-                    parse_4bpp_graphic(
-                        fp.read(graphic_size), font_width // PIXELS_PER_BYTE
-                    )
-                )
+        # Read the whole character table at once instead of entry by entry
+        entry_dtype = np.dtype(entry_fields)
+        fnt_entries = np.frombuffer(
+            fp.read(character_length * entry_dtype.itemsize), dtype=entry_dtype
+        )
 
-            character_table[chr(code_point)] = FntCharacter(graphic, width)
+        graphics: list[FntCharacterGraphic | None] = [None] * character_length
+
+        if parse_graphics:
+            graphics = [
+                FntCharacterGraphic(graphic)
+                for graphic in parse_4bpp_graphic(
+                    fnt_entries["graphic"].tobytes(), font_width // PIXELS_PER_BYTE
+                ).reshape(character_length, font_height, font_width)
+            ]
+
+        character_table: OrderedDict[str, FntCharacter] = OrderedDict(
+            (chr(code_point), FntCharacter(graphic, width))
+            for code_point, width, graphic in zip(
+                fnt_entries["code_point"].tolist(),
+                fnt_entries["width"].tolist(),
+                graphics,
+                strict=True,
+            )
+        )
 
         return cls(character_table, font_height, font_width, graphic_size)
 
@@ -198,18 +214,37 @@ class Fnt(BaseFileFormat, BaseCharacterTable):
                 b"\0" for _ in range(FNT_NDS_HEADER_LENGTH - FNT_NDS_IDENTIFIER_LENGTH)
             )
 
-        for code_point, character in self.font.items():
-            fp.write(
-                struct.pack(
-                    FNT_CHARACTER_ENTRY_FORMAT, ord(code_point), character.width
-                )
-            )
+        code_points = np.fromiter(
+            map(ord, self.font), dtype=np.uint32, count=len(self.font)
+        )
 
-            if write_graphics:
-                write_4bpp_graphic(
-                    fp,
-                    self._get_fnt_graphics(character).reshape(-1),
-                )
+        if (non_bmp := np.flatnonzero(code_points > 0xFFFF)).size > 0:
+            character = self[non_bmp[0]]
+
+            raise FileFormatError(
+                f"Character '{character}' cannot be encoded to fnt"
+            ) from non_bmp_encode_error(character)
+
+        entry_fields = FNT_CHARACTER_ENTRY_DTYPE.descr
+
+        if write_graphics:
+            entry_fields.append(("graphic", "u1", (self.graphic_size,)))
+
+        # Build every character entry at once so they can be written in one go
+        fnt_entries = np.empty(len(self.font), dtype=entry_fields)
+        fnt_entries["code_point"] = code_points
+        fnt_entries["width"] = [character.width for character in self.font.values()]
+
+        if write_graphics:
+            fnt_entries["graphic"] = np.array(
+                [
+                    pack_4bpp_graphic(self._get_fnt_graphics(character))
+                    for character in self.font.values()
+                ],
+                dtype=np.uint8,
+            ).reshape(len(self.font), self.graphic_size)
+
+        fp.write(fnt_entries)
 
         if version == "PSP":
             fp.write(FNT_PSP_IDENTIFIER)
@@ -12,13 +12,13 @@ from __future__ import annotations
 
 import csv
 import struct
-from io import StringIO
+from functools import cached_property
 from typing import BinaryIO, TextIO
 
 import attrs
-from bidict import OrderedBidict
+import numpy as np
 
-from legacy_puyo_tools.exceptions import FileFormatError
+from legacy_puyo_tools.exceptions import FileFormatError, non_bmp_encode_error
 from legacy_puyo_tools.formats._csv import CSV_TABLE_HEADER, get_csv_reader
 from legacy_puyo_tools.formats.base import (
     BaseCharacterTable,
@@ -28,6 +28,10 @@ from legacy_puyo_tools.formats.base import (
 FPD_CHARACTER_ENTRY_FORMAT = "<HB"
 """The format of a fpd character entry. Two bytes for character's Unicode code point and
 one byte for character width."""
+FPD_CHARACTER_ENTRY_DTYPE = np.dtype([("code_point", "<u2"), ("width", "u1")])
+"""The numpy equivalent of `FPD_CHARACTER_ENTRY_FORMAT`."""
+FPD_MAX_CHARACTER_WIDTH = 0xFF
+"""The largest width that fits in the single byte of a fpd character entry."""
 
 
 @attrs.frozen
@@ -95,34 +99,55 @@ class Fpd(BaseFileFormat, BaseCharacterTable):
     other and the indices is offset by multiples of `0x03`. I.e. The 1st character is at
     index `0x00`, the 2nd character is at index `0x03`, the 3rd character is at index
     `0x06`, etc.
+
+    The entries are stored as a string of characters and the bytes of their widths,
+    where the character and width of an entry share the same index.
     """
 
-    entries: OrderedBidict[int, int | FpdCharacter]
-    """A ordered bidirectional dictionary of fpd character entries."""
+    code_points: str
+    """All of the characters in the fpd character table, one character per entry."""
+    widths: bytes
+    """The width of each character in `code_points`."""
 
-    def __getitem__(self, index: int) -> str:
-        """Return a character from the fpd character table."""
-        character = self.entries[index]
+    def __attrs_post_init__(self) -> None:
+        """Check that every character has a width.
 
-        while isinstance(character, int):
-            character = self.entries[character]
+        Raises:
+            ValueError: The number of characters and widths are not the same.
+        """
+        if len(self.code_points) != len(self.widths):
+            raise ValueError(
+                "The number of characters and widths in the fpd are not the same."
+            )
 
-        return str(character)
+    @cached_property
+    def _lookup_table(self) -> dict[str, int]:
+        """The index of each character in `code_points`.
 
-    def __str__(self) -> str:
-        """Return all of the characters in the fpd character table as a string."""
-        with StringIO() as string_buffer:
-            for character in self.entries.inverse:
-                while isinstance(character, int):
-                    character = self.entries[character]
+        It is only created the first time a character is looked up, since converting
+        a fpd does not need it.
+        """
+        # Go through the characters backwards so duplicate characters are mapped to
+        # the index of their first entry
+        return dict(
+            zip(
+                reversed(self.code_points),
+                range(len(self.code_points) - 1, -1, -1),
+                strict=True,
+            )
+        )
 
-                string_buffer.write(str(character))
+    def __getitem__(self, index: int) -> str:
+        """Return a character from the fpd character table."""
+        return self.code_points[index]
 
-            return string_buffer.getvalue()
+    def __str__(self) -> str:
+        """Return all of the characters in the fpd character table as a string."""
+        return self.code_points
 
     def get_index(self, character: str) -> int:
         """Return the index of a character from the fpd character table."""
-        return self.entries.inverse[FpdCharacter(character)]
+        return self._lookup_table[character]
 
     @classmethod
     def decode(cls, fp: BinaryIO) -> Fpd:
@@ -140,28 +165,24 @@ class Fpd(BaseFileFormat, BaseCharacterTable):
         Returns:
             A fpd character table.
         """
-        character_table: OrderedBidict[int, int | FpdCharacter] = OrderedBidict()
-
         try:
-            fpd_characters = struct.iter_unpack(FPD_CHARACTER_ENTRY_FORMAT, fp.read())
-        except struct.error as e:
+            fpd_entries = np.frombuffer(fp.read(), dtype=FPD_CHARACTER_ENTRY_DTYPE)
+        except ValueError as e:
             raise FileFormatError(
                 "The given fpd character table contains entries that does not "
                 "conform to the fpd character format."
             ) from e
 
-        for i, (code_point, width) in enumerate(fpd_characters):
-            code_point = FpdCharacter(chr(code_point), width)
-
-            if (character_index := character_table.inverse.get(code_point, -1)) != -1:
-                while character_table.inverse.get(character_index, -1) != -1:
-                    character_index = character_table.inverse.get(character_index, -1)
-
-                character_table.put(i, character_index)
-            else:
-                character_table.put(i, code_point)
+        # Decode all of the code points at once, UTF-32 is used instead of UTF-16 so
+        # each entry stays as a single character even if it is a surrogate
+        code_points = (
+            fpd_entries["code_point"]
+            .astype("<u4")
+            .tobytes()
+            .decode("utf-32-le", "surrogatepass")
+        )
 
-        return cls(character_table)
+        return cls(code_points, fpd_entries["width"].tobytes())
 
     def encode(self, fp: BinaryIO) -> None:
         """Encode the fpd character table to a file-like object.
@@ -176,16 +197,23 @@ class Fpd(BaseFileFormat, BaseCharacterTable):
                 A character in the fpd character table cannot be encoded to fmp because
                 the character is not in the Basic Multilingual Plane.
         """
-        for character in self.entries.inverse:
-            while isinstance(character, int):
-                character = self.entries[character]
+        code_points = np.frombuffer(
+            self.code_points.encode("utf-32-le", "surrogatepass"), dtype="<u4"
+        )
 
-            try:
-                fp.write(character.encode())
-            except UnicodeEncodeError as e:
-                raise FileFormatError(
-                    f"Character '{character}' cannot be encoded to fpd"
-                ) from e
+        if (non_bmp := np.flatnonzero(code_points > 0xFFFF)).size > 0:
+            character = self.code_points[non_bmp[0]]
+
+            raise FileFormatError(
+                f"Character '{character}' cannot be encoded to fpd"
+            ) from non_bmp_encode_error(character)
+
+        fpd_entries = np.empty(len(code_points), dtype=FPD_CHARACTER_ENTRY_DTYPE)
+        fpd_entries["code_point"] = code_points
+        fpd_entries["width"] = np.frombuffer(self.widths, dtype=np.uint8)
+
+        # Write the entries straight from the array instead of copying them to bytes
+        fp.write(fpd_entries)
 
     @classmethod
     def read_csv(cls, fp: TextIO) -> Fpd:
@@ -196,27 +224,41 @@ class Fpd(BaseFileFormat, BaseCharacterTable):
                 A file-like object in text mode to a CSV file that has a list of
                 characters and widths.
 
+        Raises:
+            FileFormatError:
+                An entry in the CSV file does not contain exactly one character.
+            FileFormatError:
+                An entry in the CSV file has a width that does not fit in a byte.
+
         Returns:
             A fpd character table.
         """
-        character_table: OrderedBidict[int, int | FpdCharacter] = OrderedBidict()
+        code_points: list[str] = []
+        widths: list[int] = []
 
-        for i, entry in enumerate(get_csv_reader(fp)):
+        csv_reader = get_csv_reader(fp)
+
+        for entry in csv_reader:
             code_point, width = entry.values()
 
-            fpd_character = FpdCharacter(code_point, int(width, base=16))
+            if len(code_point) != 1:
+                raise FileFormatError(
+                    f"Entry '{code_point}' in the given csv is not a single character."
+                )
 
-            if (
-                character_index := character_table.inverse.get(fpd_character, -1)
-            ) != -1:
-                while character_table.inverse.get(character_index, -1) != -1:
-                    character_index = character_table.inverse.get(character_index, -1)
+            character_width = int(width, base=16)
 
-                character_table.put(i, character_index)
-            else:
-                character_table.put(i, fpd_character)
+            if not 0 <= character_width <= FPD_MAX_CHARACTER_WIDTH:
+                raise FileFormatError(
+                    f"Entry '{code_point}' on row {csv_reader.line_num} in the given "
+                    f"csv has a width of {width}, which is not between 0x0 and "
+                    f"{hex(FPD_MAX_CHARACTER_WIDTH)}."
+                )
 
-        return cls(character_table)
+            code_points.append(code_point)
+            widths.append(character_width)
+
+        return cls("".join(code_points), bytes(widths))
 
     def write_csv(self, fp: TextIO) -> None:
         """Write the fpd character table to a file-like object.
@@ -229,15 +271,7 @@ class Fpd(BaseFileFormat, BaseCharacterTable):
 
         csv_writer.writeheader()
 
-        for character in self.entries.inverse:
-            while isinstance(character, int):
-                character = self.entries[character]
-
-            csv_writer.writerow(
-                attrs.asdict(
-                    character,
-                    value_serializer=lambda _, __, value: (
-                        hex(value) if isinstance(value, int) else value
-                    ),
-                )
-            )
+        csv_writer.writerows([
+            {"code_point": code_point, "width": hex(width)}
+            for code_point, width in zip(self.code_points, self.widths, strict=True)
+        ])
@@ -18,12 +18,12 @@ supports Puyo Puyo 7 and might support Puyo Puyo! 15th Anniversary.
 from __future__ import annotations
 
 import io
-from io import StringIO
-from itertools import pairwise
-from os import SEEK_END
+import struct
+from itertools import chain, pairwise
 from typing import BinaryIO
 
 import attrs
+import numpy as np
 from lxml import etree
 
 from legacy_puyo_tools.exceptions import FileFormatError
@@ -33,17 +33,96 @@ from legacy_puyo_tools.formats.base import (
 )
 from legacy_puyo_tools.typing import MtxOffsetSize, MtxString
 
-MTX_ENDIAN = "little"
 MTX_LENGTH_WORD_SIZE = 4
 MTX_CHARACTER_WORD_SIZE = 2
+MTX_CHARACTER_DTYPE = np.dtype("<u2")
+
+MTX_ARROW = 0xF813
+MTX_UNKNOWN_CONTROL = 0xF883
+MTX_NEWLINE = 0xFFFD
+MTX_END_OF_STRING = 0xFFFF
+
+MTX_CONTROL_TEXT = {
+    # TODO: Figure out what this control character does
+    MTX_UNKNOWN_CONTROL: "0xF883",
+    MTX_NEWLINE: "\n",
+}
+"""Control characters that are written to XML as text."""
+MTX_CONTROL_CHARACTERS = frozenset((MTX_ARROW, MTX_END_OF_STRING, *MTX_CONTROL_TEXT))
+"""All of the control characters, so regular characters only need a single lookup."""
+
+MTX_HEADER_STRUCT = struct.Struct("<3I")
+"""The mtx length and the identifier read as two 32 bit words, to detect both offset
+sizes at once."""
 
 MTX32_IDENTIFIER = 8
-MTX32_IDENTIFIER_WORD_SIZE = 4
 MTX32_OFFSET_WORD_SIZE = 4
+MTX32_OFFSET_STRUCT = struct.Struct("<I")
+MTX32_OFFSET_DTYPE = np.dtype("<u4")
 
 MTX64_IDENTIFIER = 16
-MTX64_IDENTIFIER_WORD_SIZE = 8
 MTX64_OFFSET_WORD_SIZE = 8
+MTX64_OFFSET_STRUCT = struct.Struct("<Q")
+MTX64_OFFSET_DTYPE = np.dtype("<u8")
+
+
+def _split_string(string: MtxString, separator: int) -> list[MtxString]:
+    strings: list[MtxString] = []
+    start = 0
+
+    while True:
+        try:
+            end = string.index(separator, start)
+        except ValueError:
+            strings.append(string[start:])
+
+            return strings
+
+        strings.append(string[start:end])
+        start = end + 1
+
+
+def _read_mtx_header(mtx_data: bytes) -> tuple[int, struct.Struct, np.dtype]:
+    # Check if the mtx uses 32 bit offsets or 64 bit offsets. Since the format is
+    # little endian and the known values are 8 or 16 for 32 and 64 respectively,
+    # the low word holds the identifier and the high word must be zero if the
+    # offset is 64 bits.
+    try:
+        mtx_length, identifier, identifier_high = MTX_HEADER_STRUCT.unpack_from(
+            mtx_data
+        )
+    except struct.error as e:
+        raise FileFormatError("The given data is not in a valid mtx format.") from e
+
+    if mtx_length == 0 or len(mtx_data) % mtx_length != 0:
+        raise FileFormatError(
+            f"The size of the mtx is incorrect.\nExpected: {mtx_length}\nActual: "
+            f"{len(mtx_data)}"
+        )
+
+    if identifier == MTX32_IDENTIFIER:
+        return mtx_length, MTX32_OFFSET_STRUCT, MTX32_OFFSET_DTYPE
+
+    if identifier == MTX64_IDENTIFIER and identifier_high == 0:
+        return mtx_length, MTX64_OFFSET_STRUCT, MTX64_OFFSET_DTYPE
+
+    raise FileFormatError("The given data is not in a valid mtx format.")
+
+
+def _get_string_bounds(
+    sections: np.ndarray, mtx_length: int, string_table_offset: int
+) -> list[int]:
+    # Add the mtx length to the sections so we can read to end of the mtx
+    string_bounds = np.append(sections.astype(np.uint64), np.uint64(mtx_length))
+
+    # The strings are stored one after another, so they can be split out from the
+    # whole string table as long as each string starts on a character boundary
+    if np.any(string_bounds[1:] < string_bounds[:-1]) or np.any(
+        (string_bounds[:-1] - string_table_offset) % MTX_CHARACTER_WORD_SIZE
+    ):
+        raise FileFormatError("The given data is not in a valid mtx format.")
+
+    return ((string_bounds - string_table_offset) // MTX_CHARACTER_WORD_SIZE).tolist()
 
 
 @attrs.define
@@ -57,128 +136,176 @@ class Mtx(BaseFileFormat):
                 "Unable to perform seek operations on the file handler."
             )
 
-        mtx_length = int.from_bytes(fp.read(MTX_LENGTH_WORD_SIZE), MTX_ENDIAN)
+        mtx_data = fp.read()
+        mtx_length, offset_struct, offset_dtype = _read_mtx_header(mtx_data)
 
-        if fp.seek(0, SEEK_END) % mtx_length != 0:
-            raise FileFormatError(
-                f"The size of the mtx is incorrect.\nExpected: {mtx_length}\nActual: "
-                f"{fp.tell()}"
-            )
+        try:
+            section_table_position = MTX_LENGTH_WORD_SIZE + offset_struct.size * 2
 
-        fp.seek(MTX_LENGTH_WORD_SIZE)
-
-        identifier_word = fp.read(MTX32_IDENTIFIER_WORD_SIZE)
-        identifier = int.from_bytes(identifier_word, MTX_ENDIAN)
-
-        # Check if the mtx uses 32 bit offsets or 64 bit offsets. Since the format is
-        # little endian and the known values are 8 or 16 for 32 and 64 respectively,
-        # we can check that the identifier is still 16 if the offset is 64 bits.
-        if identifier == MTX32_IDENTIFIER:
-            offset_word_size = MTX32_OFFSET_WORD_SIZE
-        elif (
-            identifier
-            == int.from_bytes(
-                identifier_word
-                + fp.read(MTX64_IDENTIFIER_WORD_SIZE - MTX32_IDENTIFIER_WORD_SIZE),
-                MTX_ENDIAN,
+            (section_table_offset,) = offset_struct.unpack_from(
+                mtx_data, section_table_position - offset_struct.size
             )
-            == MTX64_IDENTIFIER
-        ):
-            offset_word_size = MTX64_OFFSET_WORD_SIZE
-        else:
-            raise FileFormatError("The given data is not in a valid mtx format.")
-
-        def read_bytes(word_size: int) -> int:
-            return int.from_bytes(fp.read(word_size), MTX_ENDIAN)
-
-        section_table_offset = read_bytes(offset_word_size)
-        string_table_offset = read_bytes(offset_word_size)
-
-        sections: list[int] = [string_table_offset]
-
-        sections.extend(
-            read_bytes(offset_word_size)
-            for _ in range(
-                ((string_table_offset - section_table_offset) // offset_word_size) - 1
+            (string_table_offset,) = offset_struct.unpack_from(
+                mtx_data, section_table_position
             )
-        )
-
-        # Add the mtx length to the sections so we can read to end of stream
-        sections.append(mtx_length)
 
-        strings: list[MtxString] = []
-
-        for current_string_offset, next_string_offset in pairwise(sections):
-            strings.append([
-                read_bytes(MTX_CHARACTER_WORD_SIZE)
-                for _ in range(
-                    (next_string_offset - current_string_offset)
-                    // MTX_CHARACTER_WORD_SIZE
-                )
-            ])
-
-        return cls(strings)
-
-    def encode(self, fp: BinaryIO, *, offset_size: MtxOffsetSize = 32) -> None:
+            section_count = (
+                string_table_offset - section_table_offset
+            ) // offset_struct.size
+
+            if section_count < 1:
+                raise FileFormatError("The given data is not in a valid mtx format.")
+        except struct.error as e:
+            raise FileFormatError("The given data is not in a valid mtx format.") from e
+
+        try:
+            sections = np.frombuffer(
+                mtx_data,
+                dtype=offset_dtype,
+                count=section_count,
+                offset=section_table_position,
+            )
+        except ValueError as e:
+            raise FileFormatError("The given data is not in a valid mtx format.") from e
+
+        string_bounds = _get_string_bounds(sections, mtx_length, string_table_offset)
+
+        # Convert the characters to a list once and slice it, as creating an array for
+        # each string is slower than slicing a list
+        character_list: list[int] = np.frombuffer(
+            mtx_data,
+            dtype=MTX_CHARACTER_DTYPE,
+            count=string_bounds[-1],
+            offset=string_table_offset,
+        ).tolist()
+
+        return cls([
+            character_list[start:end] for start, end in pairwise(string_bounds)
+        ])
+
+    def encode(
+        self,
+        fp: BinaryIO,
+        *,
+        offset_size: MtxOffsetSize = 32,
+        scratch: bytearray | None = None,
+    ) -> None:
+        """Encode the mtx to a file-like object.
+
+        Arguments:
+            fp:
+                The file-like object in binary mode that the mtx will be encoded to.
+            offset_size:
+                The size of the section and string offsets in bits, defaults to `32`.
+            scratch:
+                A buffer to lay out the mtx in before it is written, so that encoding
+                many mtx can reuse the same memory. It is grown if it is too small.
+        """
         if offset_size == 64:
             offset_word_size = MTX64_OFFSET_WORD_SIZE
             offset_identifier = MTX64_IDENTIFIER
+            offset_struct = MTX64_OFFSET_STRUCT
         else:
             offset_word_size = MTX32_OFFSET_WORD_SIZE
             offset_identifier = MTX32_IDENTIFIER
+            offset_struct = MTX32_OFFSET_STRUCT
 
         # mtx_length, mtx_identifier, mtx_section_offset
-        header_widths = [MTX_LENGTH_WORD_SIZE, offset_word_size, offset_word_size]
-        header_length = sum(header_widths)
+        header_length = MTX_LENGTH_WORD_SIZE + offset_word_size * 2
 
         # mtx_string_offsets
-        mtx_length = header_length + (offset_word_size * len(self.strings))
+        string_table_offset = header_length + (offset_word_size * len(self.strings))
+        mtx_length = string_table_offset
 
         string_offsets: list[int] = []
-        string_lengths = [
-            len(string) * MTX_CHARACTER_WORD_SIZE for string in self.strings
-        ]
 
-        for string_length in string_lengths:
+        for string in self.strings:
             string_offsets.append(mtx_length)
-            mtx_length += string_length
+            mtx_length += len(string) * MTX_CHARACTER_WORD_SIZE
 
-        def write_bytes(data: int, length: int) -> None:
-            fp.write(data.to_bytes(length, MTX_ENDIAN))
+        # Lay out the whole mtx in memory first so it can be written in one go
+        if scratch is None:
+            mtx_buffer = bytearray(mtx_length)
+        else:
+            if len(scratch) < mtx_length:
+                scratch.extend(bytes(mtx_length - len(scratch)))
+
+            mtx_buffer = scratch
+
+        struct.pack_into(
+            f"<I{2 + len(self.strings)}{offset_struct.format.lstrip('<')}",
+            mtx_buffer,
+            0,
+            mtx_length,
+            offset_identifier,
+            header_length,
+            *string_offsets,
+        )
 
-        write_bytes(mtx_length, MTX_LENGTH_WORD_SIZE)
-        write_bytes(offset_identifier, offset_word_size)
-        write_bytes(header_length, offset_word_size)
+        # The strings are stored one after another right after the section table, so
+        # all of them can be copied into the buffer at once
+        character_count = (mtx_length - string_table_offset) // MTX_CHARACTER_WORD_SIZE
+
+        np.frombuffer(
+            mtx_buffer,
+            dtype=MTX_CHARACTER_DTYPE,
+            count=character_count,
+            offset=string_table_offset,
+        )[:] = np.fromiter(
+            chain.from_iterable(self.strings),
+            dtype=MTX_CHARACTER_DTYPE,
+            count=character_count,
+        )
 
-        for offset in string_offsets:
-            write_bytes(offset, offset_word_size)
+        with memoryview(mtx_buffer) as mtx_view:
+            fp.write(mtx_view[:mtx_length])
 
-        for string in self.strings:
-            for character in string:
-                write_bytes(character, MTX_CHARACTER_WORD_SIZE)
+    def write_xml(self, fp: BinaryIO, font: BaseCharacterTable) -> None:
+        """Write the mtx as XML to a file-like object.
 
-    def write_xml(self, font: BaseCharacterTable) -> bytes:
-        root = etree.Element("mtx")
-        sheet = etree.SubElement(root, "sheet")
+        Arguments:
+            fp:
+                The file-like object in binary mode that the XML will be written to.
+            font:
+                The character table used to convert the characters in the mtx.
+        """
+        dialogs: list[MtxString] = []
 
         for string in self.strings:
-            dialog = etree.SubElement(sheet, "text")
-
-            with StringIO() as string_buffer:
-                for character in string:
-                    match character:
-                        case 0xF813:
-                            dialog.append(etree.Element("arrow"))
-                        # TODO: Figure out what this control character does
-                        case 0xF883:
-                            string_buffer.write("0xF883")
-                        case 0xFFFD:
-                            string_buffer.write("\n")
-                        case 0xFFFF:
-                            break
-                        case _:
-                            string_buffer.write(font[character])
-
-                dialog.text = string_buffer.getvalue()
-
-        return etree.tostring(root, encoding="utf-8", xml_declaration=True)
+            try:
+                dialogs.append(string[: string.index(MTX_END_OF_STRING)])
+            except ValueError:
+                dialogs.append(string)
+
+        # Look up every character used once, so each character in the dialogs only
+        # needs a single dictionary lookup. Arrows are written as elements instead.
+        # The characters are indexed from a tuple of the table, as indexing some
+        # character tables directly is not constant time.
+        characters = tuple(font)
+        translation_table = {
+            character: characters[character]
+            for character in set(chain.from_iterable(dialogs)).difference(
+                MTX_CONTROL_CHARACTERS
+            )
+        }
+        translation_table.update(MTX_CONTROL_TEXT)
+
+        def translate(string: MtxString) -> str:
+            return "".join(map(translation_table.__getitem__, string))
+
+        arrow = etree.Element("arrow")
+
+        # Write the XML as it is generated instead of building the whole tree first
+        with etree.xmlfile(fp, encoding="utf-8") as xml_file:
+            xml_file.write_declaration()
+
+            with xml_file.element("mtx"), xml_file.element("sheet"):
+                for string in dialogs:
+                    with xml_file.element("text"):
+                        text, *arrow_tails = _split_string(string, MTX_ARROW)
+
+                        xml_file.write(translate(text))
+
+                        for arrow_tail in arrow_tails:
+                            xml_file.write(arrow)
+                            xml_file.write(translate(arrow_tail))
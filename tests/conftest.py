@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2025 Samuel Wu
+#
+# SPDX-License-Identifier: MIT
+
+"""Fixtures that are shared across the tests."""
+
+from pathlib import Path
+
+import pytest
+
+from legacy_puyo_tools.formats.fpd import Fpd
+
+
+@pytest.fixture(scope="session")
+def sample_fpd() -> Fpd:
+    """Decode the sample fpd once for the tests that only read from it.
+
+    The data directory is read directly, as `lazy_datadir` is function scoped and the
+    sample is never written to.
+
+    Returns:
+        The sample fpd character table.
+    """
+    with (Path(__file__).parent / "fpd_test" / "sample.fpd").open("rb") as fp:
+        return Fpd.decode(fp)
@@ -60,12 +60,17 @@ def test_fmp_conversion(
 
         result = cli_runner.invoke(convert_fmp, input_arguments)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
 
         with Image.open(output_path) as converted_image:
-            difference = ImageChops.difference(expected_image, converted_image)
+            # Only look for the difference if the raw pixel data is not the same
+            if (converted_image.size, converted_image.tobytes()) != (
+                expected_image.size,
+                expected_image.tobytes(),
+            ):
+                difference = ImageChops.difference(expected_image, converted_image)
 
-            assert difference.getbbox() is None
+                assert difference.getbbox() is None
 
 
 @pytest.mark.parametrize(
@@ -100,7 +105,7 @@ def test_fmp_creation(
 
         result = cli_runner.invoke(create_fmp, input_arguments)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
 
         converted_fmp = output_path.read_bytes()
 
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2025 Samuel Wu
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for creating and converting fnt formats."""
+
+import io
+
+import numpy as np
+import pytest
+
+from legacy_puyo_tools.exceptions import FileFormatError
+from legacy_puyo_tools.formats.fnt import Fnt, FntCharacter
+from legacy_puyo_tools.typing import FntCharacterGraphic, FntFormatVersion
+
+SAMPLE_FNT_CSV = "code_point,width\nA,0x7\nB,0x6\n"
+
+
+@pytest.mark.parametrize("version", ["PTE", "NDS", "GCIX", "GVRT", "PSP"])
+def test_fnt_round_trip(version: FntFormatVersion) -> None:
+    """Test encoding a fnt and decoding it back."""
+    fnt = Fnt.read_csv(io.StringIO(SAMPLE_FNT_CSV), font_height=2, font_width=4)
+
+    with io.BytesIO() as fp:
+        fnt.encode(fp, version=version)
+        fp.seek(0)
+
+        decoded_fnt = Fnt.decode(fp)
+
+    assert str(decoded_fnt) == "AB"
+    assert decoded_fnt[1] == "B"
+    assert (decoded_fnt.font_height, decoded_fnt.font_width) == (2, 4)
+    assert [character.width for character in decoded_fnt.font.values()] == [0x7, 0x6]
+
+
+def test_fnt_empty() -> None:
+    """Test encoding a fnt without any characters and decoding it back."""
+    fnt = Fnt.read_csv(io.StringIO("code_point,width\n"), font_height=2, font_width=4)
+
+    with io.BytesIO() as fp:
+        fnt.encode(fp, version="NDS")
+        fp.seek(0)
+
+        decoded_fnt = Fnt.decode(fp)
+
+    assert not decoded_fnt.font
+    assert (decoded_fnt.font_height, decoded_fnt.font_width) == (2, 4)
+
+
+def test_fnt_missing_graphics() -> None:
+    """Test writing blank graphics for characters that do not have one."""
+    fnt = Fnt.read_csv(io.StringIO(SAMPLE_FNT_CSV), font_height=2, font_width=4)
+    graphic = np.array([[1, 0, 1, 1], [0, 1, 0, 0]], dtype=bool)
+    fnt.font["A"].graphic = FntCharacterGraphic(graphic)
+
+    with io.BytesIO() as fp:
+        fnt.encode(fp, version="NDS")
+        fp.seek(0)
+
+        decoded_fnt = Fnt.decode(fp)
+
+    first_graphic = decoded_fnt.font["A"].graphic
+    second_graphic = decoded_fnt.font["B"].graphic
+
+    assert first_graphic is not None
+    assert second_graphic is not None
+    assert np.array_equal(first_graphic, graphic)
+    assert second_graphic.shape == (2, 4)
+    assert not second_graphic.any()
+
+
+def test_fnt_exceptions() -> None:
+    """Test rejecting characters that cannot be encoded to fnt."""
+    fnt = Fnt.read_csv(io.StringIO(SAMPLE_FNT_CSV))
+    fnt.font["\U0001f600"] = FntCharacter(None, 0x8)
+
+    with io.BytesIO() as fp, pytest.raises(FileFormatError) as exc_info:
+        fnt.encode(fp)
+
+    assert isinstance(exc_info.value.__cause__, UnicodeEncodeError)
+
+
+def test_fnt_lookup() -> None:
+    """Test indexing a fnt after its characters have changed."""
+    fnt = Fnt.read_csv(io.StringIO(SAMPLE_FNT_CSV))
+
+    assert fnt[0] == "A"
+
+    fnt.font["C"] = FntCharacter(None, 0x8)
+
+    assert fnt[2] == "C"
+    assert tuple(fnt) == ("A", "B", "C")
@@ -8,6 +8,7 @@ The sample data is the following string sectioned off by language:
 ABC, 123, bo fo mo fo, 123, A, ' ', ra ri ru re ro (hiragana and katakana), A".
 """
 
+import io
 from pathlib import Path
 
 import pytest
@@ -40,7 +41,7 @@ def test_fpd_conversion(lazy_datadir: Path, output_file: str | None) -> None:
 
         result = cli_runner.invoke(convert_fpd, input_arguments)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
 
         converted_csv = output_path.read_text(encoding="utf-8")
 
@@ -68,37 +69,30 @@ def test_fpd_creation(lazy_datadir: Path, output_file: str) -> None:
 
         result = cli_runner.invoke(create_fpd, input_arguments)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
 
         converted_fpd = output_path.read_bytes()
 
         assert converted_fpd == expected_fpd
 
 
-def test_fpd_to_string(lazy_datadir: Path) -> None:
+def test_fpd_to_string(sample_fpd: Fpd) -> None:
     """Test converting to a string from a fpd character table."""
-    fpd_file = lazy_datadir / "sample.fpd"
     sample_string = "ABC123波泼摸佛一二三A らりるれろラリルレロA"
 
-    with fpd_file.open("rb") as fp:
-        assert str(Fpd.decode(fp)) == sample_string
+    assert str(sample_fpd) == sample_string
 
 
-def test_fpd_lookup(lazy_datadir: Path) -> None:
+def test_fpd_lookup(sample_fpd: Fpd) -> None:
     """Test looking up a character and index from a fpd character table."""
-    fpd_file = lazy_datadir / "sample.fpd"
-
-    with fpd_file.open("rb") as fp:
-        fpd_data = Fpd.decode(fp)
-
     # The 6th index in the sample fpd data should be '3'
-    assert fpd_data[5] == "3"
+    assert sample_fpd[5] == "3"
 
     # The character '佛' in the sample fpd data should be the 9th index
-    assert fpd_data.get_index("佛") == 9
+    assert sample_fpd.get_index("佛") == 9
 
     # The 13th index in the sample fpd data should be the "second" 'A'
-    assert fpd_data[13] == "A"
+    assert sample_fpd[13] == "A"
 
 
 def test_fpd_exceptions(lazy_datadir: Path) -> None:
@@ -117,6 +111,13 @@ def test_fpd_exceptions(lazy_datadir: Path) -> None:
     ):
         Fpd.read_csv(invalid_csv_fp)
 
+    with pytest.raises(FileFormatError):
+        Fpd.read_csv(io.StringIO("code_point,width\nAB,0x0\n"))
+
+    for width in ("0x100", "-0x1"):
+        with pytest.raises(FileFormatError, match=f"row 3 .* width of {width}"):
+            Fpd.read_csv(io.StringIO(f"code_point,width\nA,0x0\nB,{width}\n"))
+
     with (
         surrogate_csv.open("r", encoding="utf-8", newline="") as surrogate_csv_fp,
         surrogate_fpd.open("wb") as surrogate_fpd_fp,
@@ -125,3 +126,25 @@ def test_fpd_exceptions(lazy_datadir: Path) -> None:
         Fpd.read_csv(surrogate_csv_fp).encode(surrogate_fpd_fp)
 
     assert isinstance(exc_info.value.__cause__, UnicodeEncodeError)
+
+
+def test_fpd_duplicate_widths() -> None:
+    """Test keeping the width of each duplicate character in a fpd."""
+    fpd_csv = "code_point,width\nA,0x7\nB,0x6\nA,0x9\n"
+
+    with io.BytesIO() as fp:
+        Fpd.read_csv(io.StringIO(fpd_csv)).encode(fp)
+
+        assert fp.getvalue() == b"A\x00\x07B\x00\x06A\x00\x09"
+
+        fp.seek(0)
+
+        fpd = Fpd.decode(fp)
+
+    assert fpd.widths == b"\x07\x06\x09"
+    assert fpd.get_index("A") == 0
+
+    with io.StringIO(newline="") as csv_fp:
+        fpd.write_csv(csv_fp)
+
+        assert csv_fp.getvalue() == fpd_csv.replace("\n", "\r\n")
@@ -9,29 +9,52 @@ import io
 import pytest
 
 from legacy_puyo_tools._math import find_medium_divisors
+from legacy_puyo_tools.compression.lz11 import decompress_lz11
+from legacy_puyo_tools.exceptions import DecompressionError
 from legacy_puyo_tools.formats.fmp import Fmp
 from legacy_puyo_tools.formats.mtx import Mtx
 
 
-def test_find_best_ratio_divisor_pair() -> None:
+@pytest.mark.parametrize(("n", "divisors"), [(10, (2, 5)), (7, (1, 7))])
+def test_find_best_ratio_divisor_pair(n: int, divisors: tuple[int, int]) -> None:
     """Test finding the best ratio devisor pairs."""
-    assert find_medium_divisors(10) == (2, 5)
-    assert find_medium_divisors(7) == (1, 7)
+    assert find_medium_divisors(n) == divisors
 
-    with pytest.raises(ValueError, match=r"\d+ is not a natural number."):
-        find_medium_divisors(0)
 
+@pytest.mark.parametrize("n", [0, -3])
+def test_find_best_ratio_divisor_pair_exceptions(n: int) -> None:
+    """Test rejecting numbers that are not natural numbers."""
     with pytest.raises(ValueError, match=r"\d+ is not a natural number."):
-        find_medium_divisors(-3)
+        find_medium_divisors(n)
 
 
-def test_unseekable_streams() -> None:
-    """Test rejecting streams that are not seekable."""
+def test_decompress_lz11() -> None:
+    """Test decompressing LZ11 data with an overlapping back reference."""
+    compressed_data = b"\x11\x08\x00\x00\x20AB\x50\x01"
+
+    with io.BytesIO(compressed_data) as in_fp, io.BytesIO() as out_fp:
+        decompress_lz11(in_fp, out_fp)
+
+        assert out_fp.getvalue() == b"ABABABAB"
+
+    with (
+        pytest.raises(DecompressionError),
+        io.BytesIO(compressed_data[:-1]) as in_fp,
+        io.BytesIO() as out_fp,
+    ):
+        decompress_lz11(in_fp, out_fp)
 
-    class NonSeekableStream(io.BytesIO):
-        def seekable(self) -> bool:
-            return False
 
+class NonSeekableStream(io.BytesIO):
+    """A stream that reports it cannot seek."""
+
+    def seekable(self) -> bool:
+        """Return that the stream is not seekable."""
+        return False
+
+
+def test_unseekable_streams() -> None:
+    """Test rejecting streams that are not seekable."""
     with pytest.raises(io.UnsupportedOperation), NonSeekableStream() as fp:
         Fmp.decode(fp)
 
@@ -4,4 +4,76 @@
 
 """Tests for creating and converting mtx formats."""
 
-# TODO: Implement tests for creating and converting an MTX file
+# TODO: Implement tests for the mtx create and convert commands
+
+import io
+
+import pytest
+
+from legacy_puyo_tools.exceptions import FileFormatError
+from legacy_puyo_tools.formats.fpd import Fpd
+from legacy_puyo_tools.formats.mtx import Mtx
+from legacy_puyo_tools.typing import MtxOffsetSize
+
+SAMPLE_MTX_STRINGS = [
+    [0x00, 0x01, 0x02, 0xFFFD, 0x03, 0xFFFF],
+    [0x04, 0xF813, 0x05, 0xF883, 0x06, 0xFFFF],
+    [0xFFFF],
+]
+
+
+@pytest.mark.parametrize("offset_size", [32, 64])
+def test_mtx_round_trip(offset_size: MtxOffsetSize) -> None:
+    """Test encoding a mtx and decoding it back."""
+    with io.BytesIO() as fp:
+        Mtx(SAMPLE_MTX_STRINGS).encode(fp, offset_size=offset_size)
+
+        fp.seek(0)
+
+        assert Mtx.decode(fp).strings == SAMPLE_MTX_STRINGS
+
+
+def test_mtx_to_xml() -> None:
+    """Test converting a mtx to XML."""
+    font = Fpd.decode(
+        io.BytesIO(b"".join(c.encode("utf-16-le") + b"\0" for c in "ABCDEFG"))
+    )
+
+    with io.BytesIO() as fp:
+        Mtx(SAMPLE_MTX_STRINGS).write_xml(fp, font)
+
+        assert fp.getvalue() == (
+            b"<?xml version='1.0' encoding='utf-8'?>\n"
+            b"<mtx><sheet>"
+            b"<text>ABC\nD</text>"
+            b"<text>E<arrow/>F0xF883G</text>"
+            b"<text></text>"
+            b"</sheet></mtx>"
+        )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x00\x00\x00\x00",
+        b"\x08\x00\x00\x00\x09\x00\x00\x00",
+        b"\x0c\x00\x00\x00\x08\x00\x00\x00\x0c\x00\x00\x00",
+    ],
+)
+def test_mtx_exceptions(data: bytes) -> None:
+    """Test rasing exceptions when the input is in the invalid format."""
+    with pytest.raises(FileFormatError), io.BytesIO(data) as fp:
+        Mtx.decode(fp)
+
+
+def test_mtx_encode_scratch() -> None:
+    """Test reusing a scratch buffer across mtx encodes."""
+    scratch = bytearray()
+
+    for strings in (SAMPLE_MTX_STRINGS[:1], SAMPLE_MTX_STRINGS, SAMPLE_MTX_STRINGS[:1]):
+        with io.BytesIO() as expected_fp, io.BytesIO() as fp:
+            Mtx(strings).encode(expected_fp)
+            Mtx(strings).encode(fp, scratch=scratch)
+
+            assert fp.getvalue() == expected_fp.getvalue()